@@ -1,13 +1,15 @@
 # greenscale/apps/ml-engine/api/routes.py
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from models.schemas import (
     GlobalStats, 
     SectorAnalysis, 
     MarketMatrixPoint, 
     ResearchResult,
     SearchRequest,  # Added for Ticker Discovery
-    SearchResponse  # Added for Ticker Discovery
+    SearchResponse,  # Added for Ticker Discovery
+    AnomalyFeed
 )
 from services.intelligence import intelligence_service
 from services.elasticsearch_service import es_service # Imported ES service
@@ -19,6 +21,8 @@ Path: apps/ml-engine/api/routes.py
 Purpose: Exposes analytical data processed by the modular Intelligence Service.
 Logic: Direct binding to the Pydantic schemas defined in the Canvas.
 Update: Added the /search route to resolve the 404 error in Discovery.tsx.
+Update: Added the /anomalies snapshot and SSE delta stream to replace dashboard polling.
+Update: Added /reload so a regenerated Parquet snapshot pushes anomaly deltas live.
 """
 
 router = APIRouter(prefix="/ml", tags=["Intelligence"])
@@ -82,4 +86,49 @@ async def get_ticker_deep_dive(ticker: str):
             status_code=404, 
             detail=f"Ticker '{ticker}' not found in the GreenScale institutional universe."
         )
-    return data
\ No newline at end of file
+    return data
+
+@router.post("/reload")
+async def reload_engine():
+    """
+    Re-hydrates the engine from the Parquet snapshot and re-syncs Elasticsearch.
+    Drives: Anomaly stream deltas after scripts/data_generator.py or a re-score.
+    """
+    if intelligence_service.reload_lock.locked():
+        raise HTTPException(
+            status_code=409,
+            detail="Reload already in progress."
+        )
+    if not await intelligence_service.reload_engine(on_reloaded=es_service.sync_universe):
+        raise HTTPException(
+            status_code=503,
+            detail="Reload aborted: source Parquet snapshot not found; serving the previous generation."
+        )
+    return {
+        "status": "reloaded",
+        "generation": intelligence_service.generation,
+        "anomalies": len(intelligence_service.anomaly_df)
+    }
+
+@router.get("/anomalies", response_model=AnomalyFeed)
+async def get_anomaly_feed():
+    """
+    Returns the current anomalous set and its data generation.
+    Drives: Initial render of anomaly lists that do not hold a stream open.
+    """
+    return intelligence_service.get_anomaly_feed()
+
+@router.get("/anomalies/stream")
+async def stream_anomaly_feed(request: Request):
+    """
+    Server-Sent Events anomaly feed.
+    Logic: Emits one 'snapshot' event, then only 'delta' events (AnomalyFeedDelta)
+    when POST /ml/reload (or another refresh_anomalies caller) moves the anomalous
+    set. A client that falls behind is resynced with a fresh snapshot instead of
+    buffering unbounded deltas.
+    """
+    return StreamingResponse(
+        intelligence_service.stream_anomalies(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -62,5 +62,15 @@ class SearchResponse(BaseModel):
 
 class AnomalyFeed(BaseModel):
     """Payload for the real-time anomaly discovery list."""
+    generation: int = 0
     total_found: int
-    anomalies: List[ResearchResult]
\ No newline at end of file
+    anomalies: List[ResearchResult]
+
+class AnomalyFeedDelta(BaseModel):
+    """Incremental update pushed on /ml/anomalies/stream after a reload or re-score."""
+    generation: int
+    base_generation: int
+    total_found: int
+    added: List[ResearchResult]
+    resolved: List[str]  # Tickers no longer flagged
+    changed: List[ResearchResult]
\ No newline at end of file
@@ -1,5 +1,6 @@
 # greenscale/apps/ml-engine/services/elasticsearch_service.py
 
+import asyncio
 import pandas as pd
 from elasticsearch import Elasticsearch, helpers
 from typing import Optional, Dict
@@ -21,6 +22,15 @@ class ElasticsearchService:
     async def sync_universe(self, df: pd.DataFrame):
         """
         Synchronizes the hydrated DataFrame with the Elasticsearch cluster.
+        Runs the blocking client in a worker thread so open anomaly streams and
+        other /ml requests are not stalled during POST /ml/reload.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._sync_universe_blocking, df)
+
+    def _sync_universe_blocking(self, df: pd.DataFrame):
+        """
+        Bulk-indexes the DataFrame with the synchronous Elasticsearch client.
         Fix: Ensures the index is fresh and mappings are strictly applied.
         """
         print(f"📡 [ES Service] Preparing to sync {len(df)} records...")
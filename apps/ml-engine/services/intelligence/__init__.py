@@ -3,8 +3,12 @@
 from .data_loader import DataLoader
 from .metrics_engine import MetricsEngine
 from .research_engine import ResearchEngine
+from .anomaly_engine import AnomalyEngine
+from .feed_broadcaster import FeedBroadcaster, encode_event
+from models.schemas import AnomalyFeed, AnomalyFeedDelta
+import asyncio
 import pandas as pd
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Callable, Awaitable, AsyncIterator
 
 """
 Institutional Intelligence Service (Unified Orchestrator)
@@ -21,17 +25,73 @@ class IntelligenceService:
         )
         self.metrics = MetricsEngine()
         self.research = ResearchEngine()
+        self.anomalies = AnomalyEngine()
+        self.feed = FeedBroadcaster()
 
         # Data Cache
         self.universe_df: Optional[pd.DataFrame] = None
         self.history_df: Optional[pd.DataFrame] = None
 
+        # Anomaly Feed State (one generation per hydration / re-score)
+        self.anomaly_df: pd.DataFrame = self.anomalies.extract_anomalies(None)
+        self.generation: int = 0
+        self._snapshot_frame: Optional[str] = None
+        # Serializes reloads so an older read can never overwrite a newer one.
+        self.reload_lock = asyncio.Lock()
+
     def hydrate_engine(self):
         """Orchestrates RAM hydration across modules."""
-        self.universe_df = self.loader.load_universe()
-        self.history_df = self.loader.load_history()
+        self._apply_snapshot(self.loader.load_universe(), self.loader.load_history())
+
+    async def reload_engine(self, on_reloaded: Optional[Callable[[pd.DataFrame], Awaitable[None]]] = None) -> bool:
+        """
+        Re-hydrates from Parquet without blocking the event loop.
+        Functionality: Reads the files in a worker thread, then swaps the cache and
+        publishes the anomaly delta back on the loop. A missing snapshot keeps the
+        current cache rather than resolving every anomaly. The whole sequence,
+        including the optional on_reloaded hook (e.g. index sync), holds reload_lock.
+        """
+        async with self.reload_lock:
+            loop = asyncio.get_running_loop()
+            universe_df = await loop.run_in_executor(None, self.loader.load_universe)
+            if universe_df is None:
+                return False
+            history_df = await loop.run_in_executor(None, self.loader.load_history)
+            self._apply_snapshot(universe_df, history_df)
+            if on_reloaded is not None:
+                await on_reloaded(universe_df)
+            return True
+
+    def _apply_snapshot(self, universe_df: Optional[pd.DataFrame], history_df: Optional[pd.DataFrame]):
+        self.universe_df = universe_df
+        self.history_df = history_df
         if self.universe_df is not None:
             print(f"✅ [Intelligence] Modular Engine Hydrated: {len(self.universe_df)} tickers.")
+        self.refresh_anomalies()
+
+    def refresh_anomalies(self):
+        """
+        Advances the anomaly generation and pushes the delta to stream subscribers.
+        Call after any reload or re-scoring of universe_df; no-op if nothing moved.
+        Run on the event loop: the generation swap must stay atomic with respect
+        to new stream subscribers taking their snapshot.
+        """
+        current = self.anomalies.extract_anomalies(self.universe_df)
+        delta = self.anomalies.diff(self.anomaly_df, current)
+        if not (delta["added"] or delta["resolved"] or delta["changed"]):
+            return
+
+        base_generation = self.generation
+        self.anomaly_df = current
+        self.generation += 1
+        self._snapshot_frame = None
+
+        self.feed.publish(encode_event("delta", self.generation, AnomalyFeedDelta(
+            generation=self.generation,
+            base_generation=base_generation,
+            total_found=len(current),
+            **delta
+        )))
 
     def get_global_stats(self) -> Dict:
         return self.metrics.calculate_global_stats(self.universe_df)
@@ -45,5 +105,42 @@ class IntelligenceService:
     def get_ticker_details(self, ticker: str) -> Optional[Dict]:
         return self.research.fetch_ticker_details(self.universe_df, self.history_df, ticker)
 
+    def get_anomaly_feed(self) -> Dict:
+        return {
+            "generation": self.generation,
+            "total_found": len(self.anomaly_df),
+            "anomalies": self.anomalies.to_records(self.anomaly_df)
+        }
+
+    def get_anomaly_snapshot_frame(self) -> str:
+        """Encoded snapshot event, built once per generation and shared by all new subscribers."""
+        if self._snapshot_frame is None:
+            self._snapshot_frame = encode_event("snapshot", self.generation, AnomalyFeed(**self.get_anomaly_feed()))
+        return self._snapshot_frame
+
+    async def stream_anomalies(
+        self, is_disconnected: Callable[[], Awaitable[bool]], heartbeat: float = 15.0
+    ) -> AsyncIterator[str]:
+        """
+        SSE frame generator behind /ml/anomalies/stream.
+        Functionality: Subscribes and captures the snapshot in one synchronous step
+        (no delta can slip in between), then relays deltas, replaces an overflowed
+        backlog with a fresh snapshot, and emits keep-alives while idle.
+        """
+        subscription = self.feed.subscribe()
+        try:
+            yield self.get_anomaly_snapshot_frame()
+            while not await is_disconnected():
+                frame = await subscription.next(timeout=heartbeat)
+                if subscription.needs_resync:
+                    subscription.needs_resync = False
+                    yield self.get_anomaly_snapshot_frame()
+                elif frame is not None:
+                    yield frame
+                else:
+                    yield ": keep-alive\n\n"
+        finally:
+            self.feed.unsubscribe(subscription)
+
 # Export as singleton to maintain existing imports
 intelligence_service = IntelligenceService()
\ No newline at end of file
@@ -0,0 +1,80 @@
+# greenscale/apps/ml-engine/services/intelligence/anomaly_engine.py
+
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Dict
+
+"""
+Intelligence: Anomaly Feed Engine
+Path: services/intelligence/anomaly_engine.py
+Purpose: Projects the anomalous set and diffs it between data generations.
+"""
+
+# Snapshot column -> ResearchResult field. Keeps the feed aligned with the
+# mapping used by ResearchEngine.fetch_ticker_details and the ES sync.
+FEED_COLUMNS = {
+    "id": "id",
+    "ticker": "ticker",
+    "name": "name",
+    "sector": "sector",
+    "market_cap_bn": "market_cap",
+    "base_esg_score": "raw_score",
+    "ai_predicted_drift": "ai_adjusted_score",
+    "anomaly_flag": "anomaly_detected",
+    "last_audit_date": "last_audit",
+}
+
+class AnomalyEngine:
+    def extract_anomalies(self, df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Projects the universe onto the anomalous set.
+        Functionality: Boolean-masks flagged rows and reshapes them into the
+        ResearchResult contract, indexed by ticker for generation alignment.
+        """
+        if df is None:
+            return pd.DataFrame(columns=list(FEED_COLUMNS.values())).set_index("ticker", drop=False)
+
+        flagged = df.loc[df['anomaly_flag'] == True, list(FEED_COLUMNS)].rename(columns=FEED_COLUMNS)
+        # Generation alignment needs a unique ticker index; the latest row wins.
+        flagged = flagged.drop_duplicates("ticker", keep="last")
+        # A non-finite score cannot be cast to the int contract; skip the row
+        # rather than failing hydration or /reload.
+        scores = flagged[["raw_score", "ai_adjusted_score"]].apply(pd.to_numeric, errors="coerce")
+        scored = np.isfinite(scores.to_numpy(dtype=float)).all(axis=1)
+        if not scored.all():
+            print(f"⚠️ [AnomalyEngine] Skipped {int((~scored).sum())} flagged rows with non-finite scores.")
+            flagged = flagged[scored]
+        # Missing ids stay null (ResearchResult.id is Optional) instead of "None".
+        flagged["id"] = flagged["id"].astype(object).where(flagged["id"].notna(), None)
+        flagged = flagged.astype({
+            "raw_score": int,
+            "ai_adjusted_score": int,
+            "anomaly_detected": bool,
+            "last_audit": str,
+        })
+        return flagged.set_index("ticker", drop=False).sort_index()
+
+    def diff(self, previous: pd.DataFrame, current: pd.DataFrame) -> Dict:
+        """
+        Computes the delta between two anomaly generations.
+        Functionality: Uses index set operations for new/resolved tickers and a
+        single aligned frame comparison for changed rows (no per-row scans).
+        """
+        added_idx = current.index.difference(previous.index)
+        resolved_idx = previous.index.difference(current.index)
+        common_idx = current.index.intersection(previous.index)
+
+        before = previous.loc[common_idx, current.columns]
+        after = current.loc[common_idx]
+        mutated = (before != after) & ~(before.isna() & after.isna())
+        changed_idx = common_idx[mutated.any(axis=1).to_numpy()]
+
+        return {
+            "added": self.to_records(current.loc[added_idx]),
+            "resolved": resolved_idx.tolist(),
+            "changed": self.to_records(current.loc[changed_idx]),
+        }
+
+    def to_records(self, df: pd.DataFrame) -> List[Dict]:
+        """Serializes a feed frame into ResearchResult dicts (validated by the caller's schema)."""
+        return df.to_dict(orient="records")
@@ -0,0 +1,72 @@
+# greenscale/apps/ml-engine/services/intelligence/feed_broadcaster.py
+
+import asyncio
+from pydantic import BaseModel
+from typing import Optional, Set
+
+"""
+Intelligence: Anomaly Feed Broadcaster
+Path: services/intelligence/feed_broadcaster.py
+Purpose: Fans a single pre-encoded anomaly delta out to every stream subscriber.
+"""
+
+def encode_event(event: str, generation: int, payload: BaseModel) -> str:
+    """
+    Encodes a schema payload as a Server-Sent Events frame (id = data generation).
+    Pydantic serialization keeps the stream on the REST contract (NaN -> null).
+    """
+    return f"id: {generation}\nevent: {event}\ndata: {payload.model_dump_json()}\n\n"
+
+class FeedSubscription:
+    """
+    A single client's bounded mailbox.
+    Backpressure: When the client falls behind and the queue fills, pending
+    deltas are discarded and the subscription is flagged for a full resync,
+    so a slow consumer never grows memory or stalls the other subscribers.
+    """
+
+    def __init__(self, max_pending: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.needs_resync = False
+
+    def offer(self, frame: str):
+        if self.needs_resync:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.needs_resync = True
+            # Wake the consumer so it can resync immediately.
+            self.queue.put_nowait(None)
+
+    async def next(self, timeout: float) -> Optional[str]:
+        """Returns the next frame, or None on resync / heartbeat timeout."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+class FeedBroadcaster:
+    def __init__(self, max_pending: int = 32):
+        self.max_pending = max_pending
+        self.subscribers: Set[FeedSubscription] = set()
+
+    def subscribe(self) -> FeedSubscription:
+        subscription = FeedSubscription(self.max_pending)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: FeedSubscription):
+        self.subscribers.discard(subscription)
+
+    def publish(self, frame: str):
+        """
+        Broadcasts an already-encoded frame.
+        Functionality: The payload is serialized once by the caller; delivery is
+        a non-blocking enqueue per subscriber (event-loop only, see
+        IntelligenceService.refresh_anomalies).
+        """
+        for subscription in list(self.subscribers):
+            subscription.offer(frame)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Resolve `services` / `models` the same way `uvicorn main:app` does from the engine root.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
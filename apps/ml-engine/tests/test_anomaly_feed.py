@@ -0,0 +1,192 @@
+# greenscale/apps/ml-engine/tests/test_anomaly_feed.py
+
+import asyncio
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from models.schemas import AnomalyFeed
+from services.intelligence import IntelligenceService
+from services.intelligence.anomaly_engine import AnomalyEngine
+from services.intelligence.feed_broadcaster import FeedBroadcaster, FeedSubscription, encode_event
+
+"""
+ML Engine: Anomaly Feed Tests
+Path: apps/ml-engine/tests/test_anomaly_feed.py
+Purpose: Covers generation diffing, stream encoding and per-client backpressure.
+"""
+
+def make_universe(rows):
+    """rows: (ticker, market_cap_bn, anomaly_flag[, id])"""
+    return pd.DataFrame([
+        {
+            "id": row[3] if len(row) > 3 else f"id-{row[0]}",
+            "ticker": row[0],
+            "name": f"{row[0]} Holdings",
+            "sector": "Technology",
+            "market_cap_bn": row[1],
+            "base_esg_score": 50,
+            "ai_predicted_drift": 42,
+            "anomaly_flag": row[2],
+            "last_audit_date": date(2024, 1, 1),
+        }
+        for row in rows
+    ])
+
+def parse_frame(frame):
+    lines = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+    return lines["event"], int(lines["id"]), json.loads(lines["data"])
+
+def make_service(tmp_path):
+    service = IntelligenceService()
+    service.loader.snapshot_path = str(tmp_path / "missing_universe.parquet")
+    service.loader.history_path = str(tmp_path / "missing_history.parquet")
+    return service
+
+# --- AnomalyEngine ---
+
+def test_diff_reports_added_resolved_and_changed():
+    engine = AnomalyEngine()
+    before = engine.extract_anomalies(make_universe([
+        ("AAA", 1.0, True), ("BBB", 2.0, True), ("CCC", 3.0, False), ("DDD", 4.0, True),
+    ]))
+    after = engine.extract_anomalies(make_universe([
+        ("AAA", 1.5, True), ("BBB", 2.0, False), ("CCC", 3.0, True), ("DDD", 4.0, True),
+    ]))
+
+    delta = engine.diff(before, after)
+
+    assert [r["ticker"] for r in delta["added"]] == ["CCC"]
+    assert delta["resolved"] == ["BBB"]
+    assert [(r["ticker"], r["market_cap"]) for r in delta["changed"]] == [("AAA", 1.5)]
+
+def test_diff_of_identical_generations_is_empty():
+    engine = AnomalyEngine()
+    current = engine.extract_anomalies(make_universe([("AAA", 1.0, True)]))
+    assert engine.diff(current, current) == {"added": [], "resolved": [], "changed": []}
+
+def test_extract_anomalies_deduplicates_tickers():
+    engine = AnomalyEngine()
+    before = engine.extract_anomalies(make_universe([("AAA", 1.0, True)]))
+    after = engine.extract_anomalies(make_universe([("AAA", 1.0, True), ("AAA", 9.0, True)]))
+
+    assert len(after) == 1
+    assert [r["market_cap"] for r in engine.diff(before, after)["changed"]] == [9.0]
+
+def test_extract_anomalies_skips_non_finite_scores():
+    universe = make_universe([("AAA", 1.0, True), ("BBB", 2.0, True), ("CCC", 3.0, True)])
+    universe = universe.astype({"base_esg_score": float, "ai_predicted_drift": float})
+    universe.loc[universe["ticker"] == "BBB", "base_esg_score"] = np.nan
+    universe.loc[universe["ticker"] == "CCC", "ai_predicted_drift"] = np.inf
+
+    anomalies = AnomalyEngine().extract_anomalies(universe)
+
+    assert list(anomalies.index) == ["AAA"]
+
+def test_encoded_snapshot_is_valid_json_for_nan_and_missing_id():
+    engine = AnomalyEngine()
+    anomalies = engine.extract_anomalies(make_universe([
+        ("AAA", np.nan, True), ("BBB", 2.0, True, None),
+    ]))
+    feed = AnomalyFeed(generation=1, total_found=2, anomalies=engine.to_records(anomalies))
+
+    event, generation, data = parse_frame(encode_event("snapshot", 1, feed))
+
+    assert (event, generation) == ("snapshot", 1)
+    assert data["anomalies"][0]["market_cap"] is None
+    assert data["anomalies"][1]["id"] is None
+
+# --- Backpressure ---
+
+def test_full_queue_collapses_to_resync_sentinel():
+    async def scenario():
+        subscription = FeedSubscription(max_pending=2)
+        for frame in ("a", "b", "c", "d"):
+            subscription.offer(frame)
+
+        assert subscription.needs_resync
+        assert subscription.queue.qsize() == 1
+        assert await subscription.next(timeout=0.1) is None
+
+    asyncio.run(scenario())
+
+# --- IntelligenceService ---
+
+def test_refresh_pushes_delta_to_subscribers(tmp_path):
+    async def scenario():
+        service = make_service(tmp_path)
+        service.universe_df = make_universe([("AAA", 1.0, True)])
+        service.refresh_anomalies()
+
+        subscription = service.feed.subscribe()
+        service.universe_df = make_universe([("AAA", 1.0, False), ("BBB", 2.0, True)])
+        service.refresh_anomalies()
+        return await subscription.next(timeout=1.0)
+
+    event, generation, data = parse_frame(asyncio.run(scenario()))
+
+    assert (event, generation) == ("delta", 2)
+    assert data["base_generation"] == 1
+    assert [r["ticker"] for r in data["added"]] == ["BBB"]
+    assert data["resolved"] == ["AAA"]
+
+def stub_disconnect(after):
+    """is_disconnected stub that reports a live client for `after` polls."""
+    polls = iter([False] * after + [True])
+
+    async def is_disconnected():
+        return next(polls)
+    return is_disconnected
+
+def test_stream_resyncs_overflowed_client_at_current_generation(tmp_path):
+    async def scenario():
+        service = make_service(tmp_path)
+        service.feed.max_pending = 1
+        stream = service.stream_anomalies(stub_disconnect(after=1))
+
+        first = await stream.__anext__()
+        subscription = next(iter(service.feed.subscribers))
+        for market_cap in (1.0, 2.0, 3.0):
+            service.universe_df = make_universe([("AAA", market_cap, True)])
+            service.refresh_anomalies()
+        resync = await stream.__anext__()
+        needs_resync = subscription.needs_resync
+
+        remaining = [frame async for frame in stream]
+        return service, first, resync, needs_resync, remaining
+
+    service, first, resync, needs_resync, remaining = asyncio.run(scenario())
+
+    assert parse_frame(first)[:2] == ("snapshot", 0)
+    event, generation, data = parse_frame(resync)
+    assert (event, generation) == ("snapshot", service.generation)
+    assert data["anomalies"][0]["market_cap"] == 3.0
+    assert not needs_resync
+    assert remaining == []
+    assert not service.feed.subscribers
+
+def test_stream_relays_deltas_and_keep_alives(tmp_path):
+    async def scenario():
+        service = make_service(tmp_path)
+        stream = service.stream_anomalies(stub_disconnect(after=2), heartbeat=0.01)
+
+        await stream.__anext__()
+        service.universe_df = make_universe([("AAA", 1.0, True)])
+        service.refresh_anomalies()
+        return [frame async for frame in stream]
+
+    delta, keep_alive = asyncio.run(scenario())
+
+    assert parse_frame(delta)[:2] == ("delta", 1)
+    assert keep_alive == ": keep-alive\n\n"
+
+def test_reload_with_missing_snapshot_keeps_generation(tmp_path):
+    service = make_service(tmp_path)
+    service.universe_df = make_universe([("AAA", 1.0, True)])
+    service.refresh_anomalies()
+
+    assert asyncio.run(service.reload_engine()) is False
+    assert service.generation == 1
+    assert list(service.anomaly_df.index) == ["AAA"]
@@ -0,0 +1,77 @@
+# greenscale/apps/ml-engine/tests/test_anomaly_routes.py
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.routes as routes
+from services.intelligence import IntelligenceService
+from tests.test_anomaly_feed import make_universe
+
+"""
+ML Engine: Anomaly Route Tests
+Path: apps/ml-engine/tests/test_anomaly_routes.py
+Purpose: Exercises /ml/anomalies and /ml/reload through FastAPI, including response_model validation.
+"""
+
+@pytest.fixture
+def service(monkeypatch):
+    service = IntelligenceService()
+    monkeypatch.setattr(routes, "intelligence_service", service)
+    return service
+
+@pytest.fixture
+def synced(monkeypatch):
+    calls = []
+
+    async def sync_universe(df):
+        calls.append(len(df))
+    monkeypatch.setattr(routes.es_service, "sync_universe", sync_universe)
+    return calls
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+def test_get_anomalies_validates_against_feed_schema(service, client):
+    service.universe_df = make_universe([("AAA", 1.0, True), ("BBB", 2.0, False)])
+    service.refresh_anomalies()
+
+    res = client.get("/ml/anomalies")
+
+    assert res.status_code == 200
+    body = res.json()
+    assert (body["generation"], body["total_found"]) == (1, 1)
+    assert body["anomalies"][0]["ticker"] == "AAA"
+    assert body["anomalies"][0]["esg_trend"] == "STABLE"
+
+def test_reload_publishes_new_generation_and_syncs_index(service, synced, client, monkeypatch):
+    monkeypatch.setattr(service.loader, "load_universe", lambda: make_universe([("AAA", 1.0, True)]))
+    monkeypatch.setattr(service.loader, "load_history", lambda: None)
+
+    res = client.post("/ml/reload")
+
+    assert res.status_code == 200
+    assert res.json() == {"status": "reloaded", "generation": 1, "anomalies": 1}
+    assert synced == [1]
+
+def test_reload_with_missing_snapshot_returns_503(service, synced, client, monkeypatch):
+    monkeypatch.setattr(service.loader, "load_universe", lambda: None)
+
+    res = client.post("/ml/reload")
+
+    assert res.status_code == 503
+    assert synced == []
+    assert service.generation == 0
+
+def test_overlapping_reload_returns_409(service, synced, client):
+    asyncio.run(service.reload_lock.acquire())
+
+    res = client.post("/ml/reload")
+
+    assert res.status_code == 409
+    assert synced == []